@@ -0,0 +1,71 @@
+import os
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+# URL patterns blocked at the CDP level: images, fonts and analytics are
+# never needed for text scraping and dominate bytes-over-the-wire
+BLOCKED_URLS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.woff*",
+    "*/analytics/*",
+    "*.google-analytics.com/*",
+    "*.googletagmanager.com/*",
+    "*.doubleclick.net/*",
+]
+
+def build_chrome_options():
+    """Shared headless Chrome options for all scrapers.
+
+    Disables images, background throttling and misc subsystems the
+    scrapers never use, and sets page_load_strategy to 'eager' so
+    driver.get returns at DOMContentLoaded instead of waiting for
+    every subresource.
+    """
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-background-timer-throttling")
+    options.add_argument("--disable-backgrounding-occluded-windows")
+    options.add_argument("--disable-renderer-backgrounding")
+    options.add_argument("--disable-ipc-flooding-protection")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-breakpad")
+    options.add_argument("--mute-audio")
+    options.add_argument("--hide-scrollbars")
+    options.add_argument("--metrics-recording-only")
+    options.add_argument("--disable-features=TranslateUI")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.page_load_strategy = "eager"
+    return options
+
+def create_driver(options=None):
+    """Create a driver, remote if SELENIUM_URL is set, else local Chrome.
+
+    Pointing SELENIUM_URL at a standalone Grid (e.g. a
+    selenium/standalone-chrome container on :4444) lets every scraper
+    reuse the same warm browser pool instead of paying Chrome startup
+    per script run.
+    """
+    if options is None:
+        options = build_chrome_options()
+    selenium_url = os.environ.get("SELENIUM_URL")
+    if selenium_url:
+        driver = webdriver.Remote(command_executor=selenium_url, options=options)
+    else:
+        driver = webdriver.Chrome(options=options)
+    block_resources(driver)
+    return driver
+
+def block_resources(driver):
+    """Block images/fonts/analytics via CDP on a fresh driver."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    except Exception:
+        pass  # CDP unavailable (e.g. remote driver); flags still apply
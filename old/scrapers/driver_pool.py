@@ -0,0 +1,40 @@
+import queue
+from contextlib import contextmanager
+
+from chrome_setup import create_driver
+
+class DriverPool:
+    """Fixed-size pool of WebDrivers reused across scrape calls.
+
+    A fresh headless Chrome costs ~1-2s startup and ~150MB; a
+    long-running orchestrator keeps one pool alive across scraper
+    invocations and pays that only once per slot. Checkouts hand each
+    driver to exactly one caller at a time — never share a checked-out
+    driver between threads.
+    """
+
+    def __init__(self, size=1):
+        self._q = queue.Queue()
+        for _ in range(size):
+            self._q.put(create_driver())
+
+    @contextmanager
+    def acquire(self):
+        """Check out a driver for the duration of a with-block."""
+        driver = self._q.get()
+        try:
+            yield driver
+        finally:
+            self._q.put(driver)
+
+    def close(self):
+        """Quit every pooled driver; call once on shutdown."""
+        while True:
+            try:
+                driver = self._q.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                driver.quit()
+            except Exception:
+                pass
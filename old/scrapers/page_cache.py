@@ -0,0 +1,27 @@
+import hashlib
+import json
+import time
+from pathlib import Path
+
+# scraped-page cache: warm reruns during development (or after a crash)
+# reparse from disk instead of refetching through Chrome
+CACHE_DIR = Path(__file__).parent / ".scrape_cache"
+TTL_SECONDS = 24 * 3600
+
+def _path(key):
+    return CACHE_DIR / (hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+def get(key):
+    """Return the cached payload for key, or None if missing or older than the TTL."""
+    path = _path(key)
+    try:
+        if time.time() - path.stat().st_mtime > TTL_SECONDS:
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+def put(key, payload):
+    """Store a JSON-serializable payload under key."""
+    CACHE_DIR.mkdir(exist_ok=True)
+    _path(key).write_text(json.dumps(payload), encoding="utf-8")
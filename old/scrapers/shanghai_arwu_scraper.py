@@ -1,30 +1,62 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from bs4 import BeautifulSoup
+from driver_pool import DriverPool
 import csv
+import re
 import time
+from html import unescape
+
+import page_cache
+
+try:
+    import httpx  # direct JSON fetch; Selenium remains the fallback
+except ImportError:
+    httpx = None
 
 URL = "https://www.shanghairanking.com/rankings/arwu/2025"
+# the endpoint the Vue table loads its rows from
+API_URL = "https://www.shanghairanking.com/api/pub/v1/arwu/rank"
 OUTPUT_FILE = "shanghai_arwu.csv"
 
-def get_universities(driver, url):
-    import re
+# compiled once; pulls the country code out of the flag-image style
+_RE_FLAG = re.compile(r'/png100/(\w+)\.png')
+# fast path: lift the name straight out of the row's raw HTML so filtered
+# rows never pay for select_one/DOM traversal
+_RE_NAME_TAG = re.compile(r'<span[^>]*class="univ-name[^"]*"[^>]*>([^<]+)<')
+
+def _table_html(driver):
+    # ship only the results table over the WebDriver wire instead of
+    # serializing the whole DOM via page_source
+    return driver.execute_script(
+        "var t = document.querySelector('table');"
+        " return t ? t.outerHTML : document.documentElement.outerHTML;"
+    )
+
+def _fetch_pages(driver, url):
+    """Fetch every pagination page and return their table HTML strings."""
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
-    
-    results = set()
+
     driver.get(url)
 
     try:
-        WebDriverWait(driver, 10).until(
+        WebDriverWait(driver, 10, poll_frequency=0.1).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, "tr[data-v-ae1ab4a8]"))
         )
     except Exception:
         time.sleep(2)
     
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    page_items = soup.select("ul.ant-pagination li.ant-pagination-item")
+    # the pagination widget is fetched on its own; the row loop below only
+    # ever needs the table
+    pagination_html = driver.execute_script(
+        "var p = document.querySelector('ul.ant-pagination');"
+        " return p ? p.outerHTML : '';"
+    )
+    # lxml is a C parser, several times faster than html.parser on these
+    # ~1500-row tables
+    page_items = BeautifulSoup(pagination_html, "lxml").select(
+        "li.ant-pagination-item"
+    )
     total_pages = 1
     if page_items:
         try:
@@ -34,69 +66,154 @@ def get_universities(driver, url):
 
     print(f"Detected total {total_pages} pages")
 
+    page_htmls = []
     for page in range(1, total_pages + 1):
         print(f"Fetching {page}/{total_pages} pages...")
-        
-        soup = BeautifulSoup(driver.page_source, "html.parser")
+        page_htmls.append(_table_html(driver))
+
+        if page < total_pages:
+            try:
+                next_button = WebDriverWait(driver, 5, poll_frequency=0.1).until(
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, "li.ant-pagination-next"))
+                )
+                next_button.click()
+                # the old 1.5s fixed sleep is replaced by waiting for the
+                # pagination widget to report the next page as active
+                WebDriverWait(driver, 10, poll_frequency=0.1).until(
+                    lambda d: d.find_element(
+                        By.CSS_SELECTOR, "li.ant-pagination-item-active"
+                    ).text.strip() == str(page + 1)
+                )
+                WebDriverWait(driver, 10, poll_frequency=0.1).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "tr[data-v-ae1ab4a8]"))
+                )
+            except Exception as e:
+                print(f"click next page button failed: {e}")
+                break
+
+    return page_htmls, total_pages
+
+def get_universities_api():
+    """Fetch the rankings straight from the JSON API — no Chrome, no
+    pagination clicks. Returns None on any failure so the caller can fall
+    back to the browser scrape."""
+    if httpx is None:
+        return None
+    try:
+        resp = httpx.get(
+            API_URL,
+            params={"version": 2025},
+            headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                "Referer": URL,
+            },
+            timeout=15,
+        )
+        resp.raise_for_status()
+        payload = resp.json()
+    except Exception as e:
+        print(f"JSON API unavailable ({e}), falling back to browser scrape")
+        return None
+
+    # the list has moved around between schema versions; look in the
+    # usual places before giving up
+    rankings = payload.get("data", payload) if isinstance(payload, dict) else payload
+    if isinstance(rankings, dict):
+        rankings = rankings.get("rankings") or rankings.get("list") or []
+    if not isinstance(rankings, list):
+        return None
+
+    results = set()
+    for entry in rankings:
+        if not isinstance(entry, dict):
+            continue
+        name = entry.get("univNameEn") or entry.get("univName") or entry.get("name")
+        region = entry.get("region") or entry.get("regionCode") or ""
+        if not name:
+            continue
+        if str(region).lower() in ("cn", "china"):
+            continue
+        results.add(name)
+
+    return sorted(results) if results else None
+
+def get_universities(driver, url):
+    # fetch/parse split: warm reruns within the cache TTL parse straight
+    # from disk without touching the browser
+    page_htmls = page_cache.get(url)
+    if page_htmls is None:
+        page_htmls, total_pages = _fetch_pages(driver, url)
+        # only a verified-complete fetch is cached: a list truncated by a
+        # failed pagination click would make every rerun inside the TTL
+        # emit an incomplete CSV without retrying the browser
+        if len(page_htmls) == total_pages:
+            page_cache.put(url, page_htmls)
+    else:
+        print(f"Loaded {len(page_htmls)} pages from cache")
+
+    results = set()
+    for page, html in enumerate(page_htmls, 1):
+        soup = BeautifulSoup(html, "lxml")
         rows = soup.select("tr[data-v-ae1ab4a8]")
-        
+
         page_count = 0
         for row in rows:
+            raw = row.decode_contents()
+
+            # cheap reject first: a pure-regex scan of the raw row is far
+            # faster than building soup nodes for rows we discard anyway
+            m = _RE_FLAG.search(raw)
+            if m is not None and m.group(1) == "cn":
+                continue
+
+            nm = _RE_NAME_TAG.search(raw)
+            if m is not None and nm is not None:
+                results.add(unescape(nm.group(1)).strip())
+                page_count += 1
+                continue
+
+            # fallback: structured parse for rows the fast regexes miss
             name_tag = row.select_one("span.univ-name")
             if not name_tag:
                 continue
             name = name_tag.get_text(strip=True)
-            
+
             country_div = row.select_one("div.region-img")
             if not country_div:
                 continue
-            
+
             style = country_div.get("style", "")
-            m = re.search(r'/png100/(\w+)\.png', style)
+            m = _RE_FLAG.search(style)
             country_code = m.group(1) if m else ""
-            
+
             if country_code == "cn":
                 continue
-            
+
             results.add(name)
             page_count += 1
 
         print(f"Found {page_count} non-Chinese universities on page {page}, total {len(results)}")
-        
-        if page < total_pages:
-            try:
-                next_button = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "li.ant-pagination-next"))
-                )
-                next_button.click()
-                time.sleep(1.5)
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "tr[data-v-ae1ab4a8]"))
-                )
-            except Exception as e:
-                print(f"click next page button failed: {e}")
-                break
-    
+
     return sorted(results)
 
 def main():
-    chrome_options = Options()
-    chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    driver = webdriver.Chrome(options=chrome_options)
+    universities = get_universities_api()
+    if universities is not None:
+        print(f"Fetched {len(universities)} universities from the JSON API")
+    else:
+        pool = DriverPool(1)
+        try:
+            with pool.acquire() as driver:
+                universities = get_universities(driver, URL)
+        finally:
+            pool.close()
 
-    try:
-        universities = get_universities(driver, URL)
-        with open(OUTPUT_FILE, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(["name"])
-            for name in universities:
-                writer.writerow([name])
-        print(f"Written {len(universities)} non-Chinese universities to {OUTPUT_FILE}")
-    finally:
-        driver.quit()
+    with open(OUTPUT_FILE, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name"])
+        for name in universities:
+            writer.writerow([name])
+    print(f"Written {len(universities)} non-Chinese universities to {OUTPUT_FILE}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,16 +1,28 @@
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
+from driver_pool import DriverPool
+from selenium.webdriver.support.ui import WebDriverWait
 import csv
 import time
 import re
 
+import page_cache
+
 URL = "https://www.uniranks.com/ranking/verified-universities"
 OUTPUT_MAIN = "uniranks_world.csv"
 OUTPUT_CN = "uniranks_cn.csv"
 CHINA_REGIONS = ["China", "Hong Kong", "Macau", "Taiwan"]
 
+# compiled once instead of per div per page
+_RE_NAME = re.compile(r"([A-Za-z0-9 .&'\-()]+?) Rank")
+_RE_LOC = re.compile(r"Location ([^|]+?)(?:\||Recognized)")
+# nav/boilerplate rejects as one alternation instead of an any() loop
+_RE_BAD_NAME = re.compile(
+    r"Rank|Loading|Home|Verified Universities|Methodology|Resources|Awards|Contact|Signup|Login"
+)
+_RE_BAD_LOC = re.compile(
+    r"Loading|Home|Verified Universities|Methodology|Resources|Awards|Contact|Signup|Login"
+)
+
 def get_universities(driver, url, writer_main, writer_cn):
     seen_main = set()
     seen_cn = set()
@@ -19,53 +31,78 @@ def get_universities(driver, url, writer_main, writer_cn):
     cn_count = 0
     while True:
         print(f"Fetching {page} pages...")
-        driver.get(f"{url}?page={page}")
-        time.sleep(2)
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        page_main = 0
-        page_cn = 0
-        for div in soup.find_all("div"):
-            text = div.get_text(" ", strip=True)
-            if "Rank" in text and "Location" in text:
-                m = re.match(r"([A-Za-z0-9 .&'\-()]+?) Rank", text)
-                name = m.group(1).strip() if m else ""
-                loc_match = re.search(r"Location ([^|]+?)(?:\||Recognized)", text)
-                location = loc_match.group(1).strip() if loc_match else ""
-                if not name or any(x in name for x in ["Rank", "Loading", "Home", "Verified Universities", "Methodology", "Resources", "Awards", "Contact", "Signup", "Login"]):
-                    continue
-                if not location or any(x in location for x in ["Loading", "Home", "Verified Universities", "Methodology", "Resources", "Awards", "Contact", "Signup", "Login"]):
-                    continue
-                location_norm = location.strip().lower().replace(" ", "")
-                is_china = any(region.lower().replace(" ", "") in location_norm for region in CHINA_REGIONS)
-                
-                if is_china:
-                    if (name, location) not in seen_cn:
-                        writer_cn.writerow([name, location])
-                        seen_cn.add((name, location))
-                        cn_count += 1
-                        page_cn += 1 
-                else:
-                    if (name, location) not in seen_main:
-                        writer_main.writerow([name, location])
-                        seen_main.add((name, location))
-                        main_count += 1
-                        page_main += 1                
-        print(f"Found {page_cn} Chinese universities on page {page}, total {cn_count} / {main_count}")
-        next_link = soup.find("a", string=re.compile(r"^»$"))
-        if not next_link:
+        page_url = f"{url}?page={page}"
+        cached = page_cache.get(page_url)
+        if cached is not None:
+            texts, has_next = cached
+        else:
+            driver.get(page_url)
+            # wake as soon as the cards have rendered instead of a fixed
+            # 2s sleep; 100ms polling keeps the residual latency small
+            settled = True
+            try:
+                WebDriverWait(driver, 10, poll_frequency=0.1).until(
+                    lambda d: d.execute_script(
+                        "return document.readyState === 'complete'"
+                        " && document.body.innerText.includes('Location');"
+                    )
+                )
+            except Exception:
+                settled = False
+                time.sleep(2)
+            # one round-trip: filter and read the matching cards in-browser
+            # instead of shipping the DOM out and walking every <div> in Python
+            texts, has_next = driver.execute_script(
+                "var texts = Array.from(document.querySelectorAll('div'))"
+                ".filter(d => d.innerText.includes('Rank') && d.innerText.includes('Location'))"
+                ".map(d => d.innerText.replace(/\\s+/g, ' ').trim());"
+                "var hasNext = Array.from(document.querySelectorAll('a'))"
+                ".some(a => a.textContent.trim() === '»');"
+                "return [texts, hasNext];"
+            )
+            # only cache pages that verifiably rendered: a timed-out page
+            # with has_next false would silently end every rerun's crawl
+            # here for the whole TTL
+            if settled:
+                page_cache.put(page_url, [texts, has_next])
+        # buffer rows per page and write them in one writerows call each
+        page_main_rows = []
+        page_cn_rows = []
+        for text in texts:
+            m = _RE_NAME.match(text)
+            name = m.group(1).strip() if m else ""
+            loc_match = _RE_LOC.search(text)
+            location = loc_match.group(1).strip() if loc_match else ""
+            if not name or _RE_BAD_NAME.search(name):
+                continue
+            if not location or _RE_BAD_LOC.search(location):
+                continue
+            location_norm = location.strip().lower().replace(" ", "")
+            is_china = any(region.lower().replace(" ", "") in location_norm for region in CHINA_REGIONS)
+
+            if is_china:
+                if (name, location) not in seen_cn:
+                    seen_cn.add((name, location))
+                    page_cn_rows.append((name, location))
+            else:
+                if (name, location) not in seen_main:
+                    seen_main.add((name, location))
+                    page_main_rows.append((name, location))
+        writer_main.writerows(page_main_rows)
+        writer_cn.writerows(page_cn_rows)
+        main_count += len(page_main_rows)
+        cn_count += len(page_cn_rows)
+        print(f"Found {len(page_cn_rows)} Chinese universities on page {page}, total {cn_count} / {main_count}")
+        if not has_next:
             break
         page += 1
     return main_count, cn_count
 
 def main():
-    chrome_options = Options()
-    chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    driver = webdriver.Chrome(options=chrome_options)
+    pool = DriverPool(1)
     try:
-        with open(OUTPUT_MAIN, "w", newline="", encoding="utf-8") as f_main, \
+        with pool.acquire() as driver, \
+             open(OUTPUT_MAIN, "w", newline="", encoding="utf-8") as f_main, \
              open(OUTPUT_CN, "w", newline="", encoding="utf-8") as f_cn:
             writer_main = csv.writer(f_main)
             writer_cn = csv.writer(f_cn)
@@ -75,7 +112,7 @@ def main():
         print(f"Written {main_count} non-Chinese universities to {OUTPUT_MAIN}")
         print(f"Written {cn_count} Chinese universities to {OUTPUT_CN}")
     finally:
-        driver.quit()
+        pool.close()
 
 if __name__ == "__main__":
     main()
@@ -1,14 +1,35 @@
+import numpy as np
 import pandas as pd
 from rapidfuzz import fuzz, process
-import unicodedata
 import re
 
-def normalize_name(name):
-    name = name.lower().strip()
-    name = unicodedata.normalize('NFKD', name).encode('ASCII', 'ignore').decode('utf-8')
-    name = re.sub(r'[^a-z0-9\s]', '', name)
-    name = re.sub(r'\s+', ' ', name).strip()
-    return name
+try:
+    import pyarrow.csv as pacsv  # multi-threaded C++ CSV parser
+except ImportError:
+    pacsv = None
+
+def load_csv(path):
+    """Read a CSV with pyarrow's parallel parser when available.
+
+    Conversion to pandas stays on NumPy-backed dtypes: the
+    .str.encode/.str.decode kernels in normalize_names do not support
+    ArrowExtensionArray columns.
+    """
+    if pacsv is not None:
+        return pacsv.read_csv(path).to_pandas()
+    return pd.read_csv(path)
+
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9\s]')
+_WS_RE = re.compile(r'\s+')
+
+def normalize_names(names):
+    """Vectorized normalization of a Series of names (lowercase ASCII,
+    alphanumerics and single spaces only)."""
+    s = names.str.lower().str.strip()
+    s = s.str.normalize('NFKD').str.encode('ascii', 'ignore').str.decode('utf-8')
+    s = s.str.replace(_NON_ALNUM_RE, '', regex=True)
+    s = s.str.replace(_WS_RE, ' ', regex=True).str.strip()
+    return s
 
 # set
 files = {
@@ -20,10 +41,19 @@ files = {
 
 similarity_threshold = 90  # set similarity threshold
 
+# intern each source as one bit so a record's source set is a single
+# uint8 mask instead of a Python set
+SOURCE_BITS = {source: 1 << i for i, source in enumerate(files.values())}
+# every possible mask rendered once up front; rows then just look up
+MASK2STR = {
+    mask: ", ".join(sorted(s for s, bit in SOURCE_BITS.items() if mask & bit))
+    for mask in range(1 << len(SOURCE_BITS))
+}
+
 # read and label sources
 dfs = []
 for file, source in files.items():
-    df = pd.read_csv(file)
+    df = load_csv(file)
     
     if "location" in df.columns:
         df = df.rename(columns={"location": "country"})
@@ -31,7 +61,7 @@ for file, source in files.items():
         df["country"] = "Unknown"
 
     df = df[["name", "country"]]
-    df["name_normalized"] = df["name"].apply(normalize_name)
+    df["name_normalized"] = normalize_names(df["name"])
     df["source"] = source
     dfs.append(df)
     print(f"Loaded {file}: {len(df)} entries")
@@ -42,52 +72,80 @@ print(f"Total raw entries: {len(all_unis)}")
 
 # deduplicate
 print("\nBegin deduplication...")
-unique_records = []
-seen_names = []  
-name_mapping = {}  
-
-for idx, row in all_unis.iterrows():
-    name_original = row["name"]  
-    name_normalized = row["name_normalized"] 
-    country = row["country"]
-    source = row["source"]
-    
-    matched_name = None
-    for existing_normalized in seen_names:
-        if fuzz.ratio(name_normalized, existing_normalized) >= similarity_threshold:
-            matched_name = existing_normalized
-            break
-    
-    if matched_name:
-        for record in unique_records:
-            if record["name_normalized"] == matched_name:
-                record["sources"].add(source)
-                if country != "Unknown" and record["country"] == "Unknown":
-                    record["country"] = country
-                elif country != "Unknown" and record["country"] != "Unknown" and country != record["country"]:
-                    pass
-                break
-    else:
-        seen_names.append(name_normalized)
-        unique_records.append({
-            "name": name_original,  
-            "name_normalized": name_normalized,
-            "country": country,
-            "sources": {source}
-        })
+# Union-find over fuzzy-match edges, instead of assigning each row to the
+# first earlier row within threshold. First-match assignment is
+# order-sensitive and can split true duplicate groups; grouping connected
+# components is not. Edges come from rapidfuzz.process.cdist — the full
+# similarity matrix per block, computed in parallel C++.
+names = all_unis["name_normalized"].tolist()
+n = len(names)
+parent = list(range(n))
+
+def _find(i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]  # path halving
+        i = parent[i]
+    return i
+
+def _union(i, j):
+    ri, rj = _find(i), _find(j)
+    if ri != rj:
+        parent[rj] = ri
 
-print(f"Entries after deduplication: {len(unique_records)} ")
+# blocking index: rows bucketed by first letter, so each cdist call covers
+# ~N/26 names; at a 90+ ratio threshold duplicates share a first letter
+blocks = {}
+for i, name in enumerate(names):
+    blocks.setdefault(name[:1], []).append(i)
+
+for indices in blocks.values():
+    if len(indices) < 2:
+        continue
+    block_names = [names[i] for i in indices]
+    scores = process.cdist(
+        block_names, block_names, scorer=fuzz.ratio,
+        score_cutoff=similarity_threshold, workers=-1, dtype=np.uint8,
+    )
+    for a, b in np.argwhere(scores >= similarity_threshold):
+        if a < b:
+            _union(indices[a], indices[b])
+
+# aggregate each component: longest name wins as canonical, sources are
+# the union, country is the first known one
+buckets = {}
+# zip over the raw column arrays: iterrows boxes every row into a Series
+# with dtype coercion, which dominates the loop at this size
+rows_iter = zip(
+    all_unis["name"].to_numpy(),
+    all_unis["country"].to_numpy(),
+    all_unis["source"].map(SOURCE_BITS).to_numpy(),
+)
+for idx, (name, country, source_bit) in enumerate(rows_iter):
+    root = _find(idx)
+    record = buckets.get(root)
+    if record is None:
+        buckets[root] = {
+            "name": name,
+            "country": country,
+            "sources": source_bit
+        }
+    else:
+        record["sources"] |= source_bit
+        if len(name) > len(record["name"]):
+            record["name"] = name
+        if country != "Unknown" and record["country"] == "Unknown":
+            record["country"] = country
 
-# save result
-final_records = []
-for record in unique_records:
-    final_records.append({
-        "name": record["name"],
-        "country": record["country"],
-        "sources": ", ".join(sorted(record["sources"]))
-    })
+print(f"Entries after deduplication: {len(buckets)} ")
 
-merged_df = pd.DataFrame(final_records)
+# save result: one vectorized mask→string lookup instead of a
+# sort+join per record
+merged_df = pd.DataFrame({
+    "name": [r["name"] for r in buckets.values()],
+    "country": [r["country"] for r in buckets.values()],
+    "sources": np.array([r["sources"] for r in buckets.values()], dtype=np.uint8),
+})
+merged_df["sources"] = merged_df["sources"].map(MASK2STR)
 merged_df = merged_df.sort_values(by=["country", "name"]).reset_index(drop=True)
 merged_df.to_csv("../data/merged_universities.csv", index=False)
 
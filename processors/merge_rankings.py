@@ -14,6 +14,11 @@ Features:
 - Normalize institution type to Public/Private
 """
 
+import csv
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 import re
 from pathlib import Path
@@ -21,6 +26,20 @@ from difflib import SequenceMatcher
 import warnings
 from tqdm import tqdm
 
+try:
+    import pyarrow  # noqa: F401
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    from rapidfuzz import fuzz as _rf_fuzz
+    from rapidfuzz.distance import Levenshtein as _rf_levenshtein
+except ImportError:
+    _rf_fuzz = None
+    _rf_levenshtein = None
+
 # Suppress FutureWarning for pd.concat
 warnings.filterwarnings("ignore", category=FutureWarning)
 
@@ -39,25 +58,39 @@ USNEWS_FILE = OUTPUT_DIR / "USnews_LAC_Rankings.csv"
 # Log file - 保存到脚本同级目录
 MERGE_LOG_FILE = SCRIPT_DIR / "merge.log"
 
-# Global list to accumulate log messages
-process_log = []
+# 控制台日志开关（大批量运行时可关闭逐条打印）
+VERBOSE = True
+
+# 标准 logging：文件 handler 惰性打开、懒格式化（替代全局 process_log 列表）
+logger = logging.getLogger("merge_rankings")
+_log_handler = logging.FileHandler(MERGE_LOG_FILE, mode="w", encoding="utf-8", delay=True)
+_log_handler.setFormatter(
+    logging.Formatter("[%(asctime)s] [%(levelname)-6s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+)
+logger.addHandler(_log_handler)
+logger.setLevel(logging.INFO)
+
+# 自定义级别，保留原 MERGE/DEDUP/SKIP 标签
+_LOG_LEVELS = {"MERGE": 21, "DEDUP": 22, "SKIP": 23}
+for _name, _level in _LOG_LEVELS.items():
+    logging.addLevelName(_level, _name)
+_LOG_LEVELS["INFO"] = logging.INFO
+_LOG_LEVELS["ERROR"] = logging.ERROR
 
 
 def log_message(message, level="INFO"):
     """
-    记录消息到全局日志列表和标准输出。
+    记录消息到日志文件和标准输出。
 
     Args:
         message: 要记录的消息
         level: 日志级别 (INFO, MERGE, DEDUP, SKIP, ERROR)
     """
-    from datetime import datetime
-
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_entry = f"[{timestamp}] [{level:6s}] {message}"
-    process_log.append(log_entry)
+    logger.log(_LOG_LEVELS.get(level, logging.INFO), "%s", message)
 
     # 打印到控制台 (使用 ASCII 符号避免编码问题)
+    if not VERBOSE:
+        return
     if level == "ERROR":
         print(f"  [ERROR] {message}")
     elif level == "MERGE":
@@ -73,6 +106,16 @@ def log_message(message, level="INFO"):
 # Output file
 MERGED_FILE = OUTPUT_DIR / "merged_rankings.csv"
 
+# 预编译热路径正则（normalize/extract 每行都会调用）
+_RE_WS = re.compile(r"\s+")
+_RE_PAREN = re.compile(r"^(.*?)\s*\((.*?)\)\s*$")
+# 单字符标点 → 空格（str.translate 一次完成，替代多次 re.sub/replace）
+_TRANS_PUNCT = str.maketrans({",": " ", ".": " ", "-": " ", "–": " ", "—": " "})
+
+# 跨 loader/dedup 共享的记忆化缓存（用普通 dict 而非 lru_cache，便于多进程 pickle）
+_NORM_CACHE: dict = {}
+_KEYS_CACHE: dict = {}
+
 # Countries/regions to exclude (China-related)
 EXCLUDE_COUNTRIES = {
     "China (Mainland)",
@@ -86,6 +129,19 @@ EXCLUDE_COUNTRIES = {
 }
 
 
+def read_input_csv(path):
+    """
+    读取输入 CSV。优先使用 pyarrow 引擎（多线程解析 + Arrow 字符串列，
+    内存远小于 Python str 对象数组）；pyarrow 不可用时回退默认引擎。
+    """
+    if HAS_PYARROW:
+        try:
+            return pd.read_csv(path, engine="pyarrow", dtype_backend="pyarrow")
+        except (ValueError, TypeError):
+            pass  # 旧版 pandas/pyarrow 不支持时回退
+    return pd.read_csv(path)
+
+
 def normalize_name(name):
     """
     温和的名称标准化（仅处理大小写和空格）：
@@ -98,18 +154,35 @@ def normalize_name(name):
     if pd.isna(name) or not name:
         return ""
 
-    s = str(name).strip()
-    # 统一大小写
-    s = s.lower()
-    # 移除逗号，用空格替代
-    s = s.replace(",", " ")
+    cached = _NORM_CACHE.get(name)
+    if cached is not None:
+        return cached
+
+    # 统一大小写、移除逗号（单次扫描）
+    s = str(name).strip().lower().replace(",", " ")
     # 归一化多余空格
-    s = re.sub(r"\s+", " ", s).strip()
-    # 移除前缀 "the "
-    s = re.sub(r"^the\s+", "", s)
+    s = _RE_WS.sub(" ", s).strip()
+    # 移除前缀 "the "（空格已归一化，startswith 比锚定正则更便宜）
+    if s.startswith("the "):
+        s = s[4:]
+    _NORM_CACHE[name] = s
     return s
 
 
+# Country normalization mappings
+COUNTRY_MAP = {
+    "United States": "United States of America",
+    "USA": "United States of America",
+    "US": "United States of America",
+    "UK": "United Kingdom",
+    "South Korea": "Republic of Korea",
+    "North Korea": "Democratic People's Republic of Korea",
+    "Netherlands": "Netherlands",
+    "Holland": "Netherlands",
+    "Macao": "Macau",
+}
+
+
 def normalize_country(country):
     """
     Normalize country name.
@@ -118,22 +191,47 @@ def normalize_country(country):
         return ""
 
     country = str(country).strip()
+    country = COUNTRY_MAP.get(country, country)
+    return country.strip()
 
-    # Country normalization mappings
-    country_map = {
-        "United States": "United States of America",
-        "USA": "United States of America",
-        "US": "United States of America",
-        "UK": "United Kingdom",
-        "South Korea": "Republic of Korea",
-        "North Korea": "Democratic People's Republic of Korea",
-        "Netherlands": "Netherlands",
-        "Holland": "Netherlands",
-        "Macao": "Macau",
-    }
 
-    country = country_map.get(country, country)
-    return country.strip()
+def normalize_name_column(col):
+    """
+    normalize_name 的列级向量化版本（pandas .str 访问器，单次 C 级遍历）。
+    规则与 normalize_name 完全一致。
+    """
+    s = col.astype("string").str.strip().str.lower()
+    s = s.str.replace(",", " ", regex=False)
+    s = s.str.replace(r"\s+", " ", regex=True).str.strip()
+    s = s.str.replace(r"^the\s+", "", regex=True)
+    return s.fillna("").astype(object)
+
+
+def normalize_country_column(col):
+    """
+    normalize_country 的列级向量化版本：映射 + 保留未映射原值。
+    """
+    s = col.astype("string").str.strip()
+    s = s.map(COUNTRY_MAP).fillna(s).str.strip()
+    return s.fillna("").astype(object)
+
+
+def normalize_nature_of_running_column(col):
+    """
+    normalize_nature_of_running 的列级向量化版本（布尔掩码级联）。
+    """
+    s = col.astype("string").str.strip().str.lower()
+    is_private = s.str.contains(
+        r"private|not for profit|independent|proprietary", regex=True
+    ).fillna(False)
+    is_public = s.str.contains(r"public|government|state|federal", regex=True).fillna(
+        False
+    )
+    return pd.Series(
+        np.select([is_private, is_public], ["Private", "Public"], default=None),
+        index=col.index,
+        dtype=object,
+    )
 
 
 def normalize_nature_of_running(status):
@@ -173,7 +271,7 @@ def extract_base_and_alias(name: str):
 
     name_original = name.strip()
     name = name_original.lower()
-    match = re.match(r"^(.*?)\s*\((.*?)\)\s*$", name)
+    match = _RE_PAREN.match(name)
     if match:
         base = match.group(1).strip()
         alias = match.group(2).strip()
@@ -242,11 +340,23 @@ def normalize_text(text: str) -> str:
     """基础清洗（去符号、统一空格）"""
     if pd.isna(text):
         return ""
-    text = re.sub(r"[,\.\-–—]+", " ", text.lower())
-    text = re.sub(r"\s+", " ", text)
+    text = text.lower().translate(_TRANS_PUNCT)
+    text = _RE_WS.sub(" ", text)
     return text.strip()
 
 
+# 通用词：仅由这些词组成的键没有区分度（防止 "university" 之类误合并）
+COMMON_WORDS = {
+    "university",
+    "college",
+    "institute",
+    "school",
+    "academy",
+    "center",
+    "centre",
+}
+
+
 def build_name_keys(name: str):
     """
     为每个学校生成一组匹配键，用于识别同一所大学。
@@ -254,6 +364,7 @@ def build_name_keys(name: str):
     重要过滤规则：
     - 忽略国家代码（USA, UK, China等）作为别名
     - 忽略主校区标识（Main Campus等）
+    - 忽略仅由通用词（university/college等）组成的键，它们没有区分度
 
     例如 'Massachusetts Institute of Technology (MIT)' 会生成：
     - 'massachusetts institute of technology (mit)'
@@ -264,6 +375,10 @@ def build_name_keys(name: str):
     - 'university of south alabama'
     - 不会添加 'usa' 因为它被过滤掉了
     """
+    cached = _KEYS_CACHE.get(name)
+    if cached is not None:
+        return cached
+
     base, alias = extract_base_and_alias(name)
     base_norm = normalize_name(base)
     alias_norm = normalize_name(alias) if alias else ""
@@ -321,6 +436,11 @@ def build_name_keys(name: str):
         if alias_norm in abbreviations:
             keys.add(abbreviations[alias_norm])
 
+    # 过滤掉仅由通用词组成的键（如 "university"），避免它们进入匹配索引
+    keys = frozenset(k for k in keys if not set(k.split()).issubset(COMMON_WORDS))
+
+    if isinstance(name, str):
+        _KEYS_CACHE[name] = keys
     return keys
 
 
@@ -333,47 +453,25 @@ def is_same_university(row_a, row_b):
     2. 名称键集合必须有交集（说明是同一所大学的不同表达形式）
     3. 额外安全检查：防止因为通用词造成的误合并
     """
-    # 比较国家（大小写不敏感）
-    country_a = (
-        str(row_a.get("Country", "")).strip().lower() if row_a.get("Country") else ""
-    )
-    country_b = (
-        str(row_b.get("Country", "")).strip().lower() if row_b.get("Country") else ""
-    )
+    # 比较国家（大小写不敏感，单次 get）
+    country_a = str(row_a.get("Country") or "").strip().lower()
+    country_b = str(row_b.get("Country") or "").strip().lower()
 
-    if not country_a or not country_b or country_a != country_b:
+    if not country_a or country_a != country_b:
         return False
 
-    # 比较名称键
-    keys_a = row_a.get("_name_keys", set())
-    keys_b = row_b.get("_name_keys", set())
-
-    intersection = keys_a.intersection(keys_b)
-    if len(intersection) == 0:
+    # 比较名称键（frozenset 交集，C 级实现）
+    intersection = row_a.get("_name_keys", frozenset()) & row_b.get(
+        "_name_keys", frozenset()
+    )
+    if not intersection:
         return False
 
     # 额外安全检查：防止仅因为包含通用词而合并
-    # 如果交集中只有"university"或"college"这样的通用词，则不合并
-    common_words = {
-        "university",
-        "college",
-        "institute",
-        "school",
-        "academy",
-        "center",
-        "centre",
-    }
-
-    # 检查交集中是否存在实质性内容（不仅仅是通用词）
-    has_substantial_match = False
-    for key in intersection:
-        # 如果交集元素不仅包含通用词，就有实质性匹配
-        words = set(key.split())
-        if not words.issubset(common_words):
-            has_substantial_match = True
-            break
-
-    return has_substantial_match
+    # （build_name_keys 已过滤纯通用词键，这里作为兜底再检查一次）
+    return any(
+        not set(key.split()).issubset(COMMON_WORDS) for key in intersection
+    )
 
 
 def is_china_related(country):
@@ -387,13 +485,51 @@ def is_china_related(country):
     return country in EXCLUDE_COUNTRIES
 
 
+def filter_china_related(df, column):
+    """
+    按国家/地区列过滤中国相关记录（分类编码比较，避免逐行字符串比较）。
+    """
+    cats = df[column].astype("category").cat
+    exclude_codes = {
+        code
+        for code, category in enumerate(cats.categories)
+        if str(category).strip() in EXCLUDE_COUNTRIES
+    }
+    if not exclude_codes:
+        return df
+    return df[~cats.codes.isin(exclude_codes)]
+
+
 def string_similarity(a, b):
     """
     Calculate string similarity ratio (0-1).
+
+    优先使用 rapidfuzz（C++ 实现，比纯 Python 的 SequenceMatcher 快 50-100 倍）。
     """
+    if _rf_fuzz is not None:
+        return _rf_fuzz.ratio(a, b) / 100.0
     return SequenceMatcher(None, a, b).ratio()
 
 
+def bounded_similarity(a, b, max_dist=3):
+    """
+    带阈值截断的编辑距离相似度 (0-1)。
+
+    先做长度预过滤：若 |len(a)-len(b)| > max_dist，编辑距离必然超过阈值，
+    直接返回 0 而不计算。rapidfuzz 的 score_cutoff 会在距离超过阈值时
+    提前中止计算（O(k·m) 而非 O(n·m)）。供未来的模糊匹配回退路径使用。
+    """
+    if abs(len(a) - len(b)) > max_dist:
+        return 0.0
+    if _rf_levenshtein is not None:
+        dist = _rf_levenshtein.distance(a, b, score_cutoff=max_dist)
+        if dist > max_dist:
+            return 0.0
+        longest = max(len(a), len(b))
+        return 1.0 - dist / longest if longest else 1.0
+    return string_similarity(a, b)
+
+
 def merge_fields(*values):
     """
     从多个值中选择第一个非空值。
@@ -420,11 +556,11 @@ def exact_name_match(name1: str, name2: str) -> bool:
 
 def deduplicate_fuzzy(df):
     """
-    智能去重算法 v3 - 支持括号别名匹配（如 A(B) ↔ A 或 A(B) ↔ B）
+    智能去重算法 v4 - 支持括号别名匹配（如 A(B) ↔ A 或 A(B) ↔ B）
 
     规则：
-    1. 国家必须相同
-    2. 名称键集合有交集 → 认定为同一所学校
+    1. 国家必须相同（按国家分桶，跨国家不比较）
+    2. 名称键集合有交集 → 认定为同一所学校（倒排索引 + 并查集，单遍 O(N·keys)）
     3. 从同一所学校的多条记录中，选择字段最完整的记录
     4. 尝试从其他记录填补空值
     5. 详细记录所有合并决策
@@ -435,91 +571,123 @@ def deduplicate_fuzzy(df):
     df = df.reset_index(drop=True)
     n = len(df)
 
-    # 为每条记录预先计算名称键
-    df["_name_keys"] = df["Name"].apply(build_name_keys)
-
-    # 追踪已处理的记录
-    used_indices = set()
-    merged_groups = []
+    # 为每条记录预先计算名称键（build_name_keys 已按名称记忆化，重复名称零成本）
+    if "_name_keys" not in df.columns:
+        df["_name_keys"] = df["Name"].map(build_name_keys)
+
+    # 并查集：每条记录一个初始group，按共享名称键合并
+    parent = list(range(n))
+
+    def find(x):
+        # 路径压缩
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(a, b):
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[rb] = ra
+
+    # 按国家分桶（分类编码，整型比较），只在同一国家内建立名称键索引
+    country_cat = pd.Categorical(df["Country"].astype(str).str.strip().str.lower())
+    empty_codes = {
+        code for code, cat in enumerate(country_cat.categories) if cat in ("", "nan")
+    }
+    buckets = {}
+    for i, code in enumerate(country_cat.codes):
+        buckets.setdefault(code, []).append(i)
+
+    all_keys = df["_name_keys"].tolist()
+    for code, indices in buckets.items():
+        if code < 0 or code in empty_codes:
+            continue  # 缺失国家的记录不参与合并
+        # 倒排索引：名称键 -> 首次出现该键的记录
+        key_to_idx = {}
+        for i in indices:
+            for key in all_keys[i]:
+                if key in key_to_idx:
+                    union(key_to_idx[key], i)
+                else:
+                    key_to_idx[key] = i
+
+    # 汇总并查集结果，保持原始行序
+    groups_by_root = {}
+    for i in range(n):
+        groups_by_root.setdefault(find(i), []).append(i)
+    merged_groups = sorted(groups_by_root.values(), key=lambda g: g[0])
     merge_details = []
 
-    for i, row_i in df.iterrows():
-        if i in used_indices:
-            continue
-
-        # 开始一个新的group
-        group = [i]
-        used_indices.add(i)
-
-        # 查找与row_i相同的其他记录
-        for j in range(i + 1, len(df)):
-            if j in used_indices:
-                continue
-
-            row_j = df.iloc[j]
-
-            if is_same_university(row_i, row_j):
-                group.append(j)
-                used_indices.add(j)
-
-        merged_groups.append(group)
-
     # 从每个group中选择代表记录
+    # （一次性转成 numpy 对象数组，避免 iloc/Series 的逐格访问与 _item_cache 膨胀）
     keep_rows = []
     merge_count = 0
 
+    columns = list(df.columns)
+    name_pos = columns.index("Name")
+    country_pos = columns.index("Country")
+    values = df.to_numpy(dtype=object)
+    notna_mask = pd.notna(values)
+    # 可填补的列：排除临时列与标识列
+    fill_positions = [
+        c
+        for c, col in enumerate(columns)
+        if not col.startswith("_") and col not in ("Name", "Country")
+    ]
+
     for group_indices in merged_groups:
         if len(group_indices) == 1:
             # 单条记录，直接保留
-            idx = group_indices[0]
-            keep_rows.append(df.iloc[idx])
+            keep_rows.append(values[group_indices[0]])
             continue
 
         # 多条记录需要合并
         merge_count += 1
 
-        # 为这个group中的每条记录计算完整度分数
-        group_with_scores = []
-        for idx in group_indices:
-            row = df.iloc[idx]
-            score = row.notna().sum()  # 非空字段数
-            group_with_scores.append((idx, row, score))
-
-        # 按完整度排序，选择最完整的
-        group_with_scores.sort(key=lambda x: x[2], reverse=True)
-
-        representative_idx, representative, _ = group_with_scores[0]
-        representative = representative.copy()
-
-        # 记录合并信息
-        country = representative.get("Country", "Unknown")
-        orig_names = " | ".join([df.iloc[idx]["Name"] for idx in group_indices])
-        merge_details.append(f"DEDUP: [{country}] {orig_names}")
-        merge_details.append(
-            f"  → Keep record #{representative_idx}: {representative['Name']}"
+        sub = values[group_indices]
+        sub_mask = notna_mask[group_indices]
+
+        # 完整度分数 = 非空字段数；选择最完整的（平分时保留靠前记录）
+        scores = sub_mask.sum(axis=1)
+        rep_pos = int(scores.argmax())
+        representative_idx = group_indices[rep_pos]
+        representative = sub[rep_pos].copy()
+
+        # 记录合并信息（原始元组，写日志时统一格式化，热循环内不做字符串拼接）
+        country = representative[country_pos]
+        merge_details.append(("dedup", country, tuple(group_indices)))
+        merge_details.append(("keep", representative_idx, representative[name_pos]))
+
+        # 尝试从其他记录填补空值（其余记录按完整度降序作为来源）
+        source_order = sorted(
+            (p for p in range(len(group_indices)) if p != rep_pos),
+            key=lambda p: scores[p],
+            reverse=True,
         )
-
-        # 尝试从其他记录填补空值
         filled_fields = []
-        for col in representative.index:
-            if col.startswith("_") or col in ["Name", "Country"]:
-                continue
-
-            if pd.isna(representative[col]) or representative[col] == "":
+        for c in fill_positions:
+            if pd.isna(representative[c]) or representative[c] == "":
                 # 从其他记录查找该字段的值
-                for alt_idx, alt_row, _ in group_with_scores[1:]:
-                    alt_val = alt_row.get(col)
-                    if pd.notna(alt_val) and str(alt_val).strip() != "":
-                        representative[col] = alt_val
-                        filled_fields.append(f"{col} from #{alt_idx}")
+                for p in source_order:
+                    alt_val = sub[p, c]
+                    if sub_mask[p, c] and str(alt_val).strip() != "":
+                        representative[c] = alt_val
+                        filled_fields.append((columns[c], group_indices[p]))
                         break
 
         if filled_fields:
-            merge_details.append(f"  → Filled: {', '.join(filled_fields)}")
+            merge_details.append(("filled", tuple(filled_fields)))
 
         keep_rows.append(representative)
 
-    result = pd.DataFrame(keep_rows).reset_index(drop=True)
+    # 单次 vstack 成 2-D 数组再建 DataFrame，避免 pandas 对逐行对象做类型推断
+    if keep_rows:
+        result = pd.DataFrame(np.vstack(keep_rows), columns=columns).infer_objects()
+    else:
+        result = pd.DataFrame(columns=columns)
 
     # 删除临时列
     cols_to_drop = [c for c in result.columns if c.startswith("_")]
@@ -535,20 +703,35 @@ def deduplicate_fuzzy(df):
     )
     log_message(f"Preservation rate: {preservation_rate:.1f}%")
 
-    # 保存详细的merge日志到脚本同级目录
-    with open(MERGE_LOG_FILE, "w", encoding="utf-8") as f:
-        f.write("=" * 90 + "\n")
-        f.write("Deduplication Merge Log\n")
-        f.write("=" * 90 + "\n\n")
-        f.write(f"Total input records: {n}\n")
-        f.write(f"Total merged groups: {merge_count}\n")
-        f.write(f"Total duplicates merged: {deduped_count}\n")
-        f.write(f"Final unique universities: {len(result)}\n")
-        f.write(f"Preservation rate: {preservation_rate:.1f}%\n")
-        f.write("\n" + "=" * 90 + "\n")
-        f.write("Detailed Merge Operations:\n")
-        f.write("=" * 90 + "\n\n")
-        f.write("\n".join(merge_details))
+    # 保存详细的merge日志（与 logger 共用同一文件句柄，顺序追加到 merge.log）
+    # 上面的 log_message 调用已经打开了 delay=True 的 handler 句柄
+    f = _log_handler.stream
+    f.write("=" * 90 + "\n")
+    f.write("Deduplication Merge Log\n")
+    f.write("=" * 90 + "\n\n")
+    f.write(f"Total input records: {n}\n")
+    f.write(f"Total merged groups: {merge_count}\n")
+    f.write(f"Total duplicates merged: {deduped_count}\n")
+    f.write(f"Final unique universities: {len(result)}\n")
+    f.write(f"Preservation rate: {preservation_rate:.1f}%\n")
+    f.write("\n" + "=" * 90 + "\n")
+    f.write("Detailed Merge Operations:\n")
+    f.write("=" * 90 + "\n\n")
+    # 统一格式化（热循环中仅积累元组）
+    for detail in merge_details:
+        kind = detail[0]
+        if kind == "dedup":
+            _, country, group = detail
+            orig_names = " | ".join(str(values[i, name_pos]) for i in group)
+            f.write(f"DEDUP: [{country}] {orig_names}\n")
+        elif kind == "keep":
+            _, idx, name = detail
+            f.write(f"  → Keep record #{idx}: {name}\n")
+        elif kind == "filled":
+            _, fields = detail
+            filled = ", ".join(f"{col} from #{idx}" for col, idx in fields)
+            f.write(f"  → Filled: {filled}\n")
+    _log_handler.flush()
 
     log_message(f"Merge log saved to: {MERGE_LOG_FILE}")
 
@@ -559,20 +742,20 @@ def load_and_clean_qs():
     """Load and clean QS rankings."""
     print("Loading QS rankings...")
     log_message("Starting QS data loading")
-    df = pd.read_csv(QS_FILE)
+    df = read_input_csv(QS_FILE)
     initial_count = len(df)
     log_message(f"QS CSV loaded: {initial_count} records")
 
     # Remove China-related institutions
-    df = df[~df["Region"].apply(is_china_related)]
+    df = filter_china_related(df, "Region")
     china_filtered = initial_count - len(df)
     if china_filtered > 0:
         log_message(f"Filtered out {china_filtered} China-related QS records")
 
     # Normalize name and country
-    df["name_normalized"] = df["Name"].apply(normalize_name)
-    df["country"] = df["Region"].apply(normalize_country)
-    df["status"] = df["Status"].apply(normalize_nature_of_running)
+    df["name_normalized"] = normalize_name_column(df["Name"])
+    df["country"] = normalize_country_column(df["Region"])
+    df["status"] = normalize_nature_of_running_column(df["Status"])
 
     df = df[
         [
@@ -596,19 +779,19 @@ def load_and_clean_the():
     """Load and clean THE rankings."""
     print("Loading THE rankings...")
     log_message("Starting THE data loading")
-    df = pd.read_csv(THE_FILE)
+    df = read_input_csv(THE_FILE)
     initial_count = len(df)
     log_message(f"THE CSV loaded: {initial_count} records")
 
     # Remove China-related institutions
-    df = df[~df["Country"].apply(is_china_related)]
+    df = filter_china_related(df, "Country")
     china_filtered = initial_count - len(df)
     if china_filtered > 0:
         log_message(f"Filtered out {china_filtered} China-related THE records")
 
     # Normalize name and country
-    df["name_normalized"] = df["Name"].apply(normalize_name)
-    df["country"] = df["Country"].apply(normalize_country)
+    df["name_normalized"] = normalize_name_column(df["Name"])
+    df["country"] = normalize_country_column(df["Country"])
     df = df[["Name", "country", "Rank", "name_normalized"]]
     df.rename(columns={"Rank": "the_rank"}, inplace=True)
 
@@ -621,14 +804,14 @@ def load_and_clean_usnews():
     """Load and clean US News LAC rankings."""
     print("Loading US News LAC rankings...")
     log_message("Starting USNews LAC data loading")
-    df = pd.read_csv(USNEWS_FILE)
+    df = read_input_csv(USNEWS_FILE)
     log_message(f"USNews LAC CSV loaded: {len(df)} records", "INFO")
 
     # Add country as United States for all LAC entries
     df["country"] = "United States of America"
 
     # Normalize name
-    df["name_normalized"] = df["Name"].apply(normalize_name)
+    df["name_normalized"] = normalize_name_column(df["Name"])
     df = df[["Name", "country", "Rank", "name_normalized"]]
     df.rename(columns={"Rank": "usnews_rank"}, inplace=True)
 
@@ -649,91 +832,54 @@ def merge_datasets(qs_df, the_df, usnews_df):
     print("\nMerging datasets...")
     log_message("Starting dataset merge process")
 
+    merge_keys = ["country", "name_normalized"]
+
+    def merge_source(base_df, source_df, source_name, rank_col):
+        """
+        按 (country, name_normalized) 做一次 outer hash-join：
+        匹配的行填充 rank 列，未匹配的行作为新学校追加。
+        """
+        merged = base_df.merge(
+            source_df[["Name", *merge_keys, rank_col]].rename(
+                columns={"Name": "_Name_src"}
+            ),
+            on=merge_keys,
+            how="outer",
+            indicator=True,
+        )
+        counts = merged["_merge"].value_counts()
+        matched = int(counts.get("both", 0))
+        new = int(counts.get("right_only", 0))
+
+        # 仅来自 source 的行：用 source 的原始名称
+        merged["Name"] = merged["Name"].combine_first(merged["_Name_src"])
+        merged = merged.drop(columns=["_Name_src", "_merge"])
+
+        log_message(
+            f"{source_name} merge complete: {matched} matched, {new} new universities added",
+            "MERGE",
+        )
+        return merged
+
     # Start with QS as base
     print("  Starting with QS data...")
     log_message(f"Base dataset: QS with {len(qs_df)} universities")
-    merged_list = qs_df.to_dict("records")
-
-    # Create a mapping for faster lookups
-    def create_lookup_map(records):
-        """Create name+country lookup map."""
-        lookup = {}
-        for i, record in enumerate(records):
-            key = (record["country"], record["name_normalized"])
-            lookup[key] = i
-        return lookup
 
     # Merge THE data
     print("  Merging THE data...")
     log_message(f"Merging THE dataset ({len(the_df)} universities)")
-    qs_lookup = create_lookup_map(merged_list)
-
-    the_matched = 0
-    the_new = 0
-    for _, the_row in the_df.iterrows():
-        key = (the_row["country"], the_row["name_normalized"])
-
-        # Only exact match, no fuzzy fallback
-        if key in qs_lookup:
-            merged_list[qs_lookup[key]]["the_rank"] = the_row["the_rank"]
-            the_matched += 1
-        else:
-            # No match found, add as new university
-            new_row = {
-                "Name": the_row["Name"],
-                "country": the_row["country"],
-                "name_normalized": the_row["name_normalized"],
-                "qs_rank": None,
-                "the_rank": the_row["the_rank"],
-                "usnews_rank": None,
-                "status": None,
-                "Latitude": None,
-                "Longitude": None,
-            }
-            merged_list.append(new_row)
-            the_new += 1
-
-    log_message(
-        f"THE merge complete: {the_matched} matched, {the_new} new universities added",
-        "MERGE",
-    )
+    result_df = merge_source(qs_df, the_df, "THE", "the_rank")
 
     # Merge USNews data
     print("  Merging US News LAC data...")
     log_message(f"Merging USNews dataset ({len(usnews_df)} universities)")
-    merged_lookup = create_lookup_map(merged_list)
-
-    usnews_matched = 0
-    usnews_new = 0
-    for _, usnews_row in usnews_df.iterrows():
-        key = (usnews_row["country"], usnews_row["name_normalized"])
-
-        # Only exact match, no fuzzy fallback
-        if key in merged_lookup:
-            merged_list[merged_lookup[key]]["usnews_rank"] = usnews_row["usnews_rank"]
-            usnews_matched += 1
-        else:
-            # No match found, add as new university
-            new_row = {
-                "Name": usnews_row["Name"],
-                "country": usnews_row["country"],
-                "name_normalized": usnews_row["name_normalized"],
-                "qs_rank": None,
-                "the_rank": None,
-                "usnews_rank": usnews_row["usnews_rank"],
-                "status": None,
-                "Latitude": None,
-                "Longitude": None,
-            }
-            merged_list.append(new_row)
-            usnews_new += 1
+    result_df = merge_source(result_df, usnews_df, "USNews", "usnews_rank")
 
-    log_message(
-        f"USNews merge complete: {usnews_matched} matched, {usnews_new} new universities added",
-        "MERGE",
-    )
+    # 补齐仅来自单一源的行缺失的列
+    for col in ["qs_rank", "the_rank", "usnews_rank", "status", "Latitude", "Longitude"]:
+        if col not in result_df.columns:
+            result_df[col] = None
 
-    result_df = pd.DataFrame(merged_list)
     print(f"  Total merged records: {len(result_df)}")
     log_message(f"Dataset merge complete: {len(result_df)} total records")
 
@@ -779,6 +925,19 @@ def finalize_output(df):
     return df
 
 
+def write_output_csv(df, path):
+    """
+    用带大缓冲的 csv.writer 流式写出结果（替代 DataFrame.to_csv 的逐行 Python 路径）。
+    空值写为空字符串，与 to_csv 输出保持一致。
+    """
+    # NaN/None → ""（与 to_csv 的空值表示一致）
+    cells = df.astype(object).where(df.notna(), "")
+    with open(path, "w", newline="", buffering=1 << 20, encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(df.columns)
+        writer.writerows(cells.itertuples(index=False, name=None))
+
+
 def verify_ranking_data(original_qs, original_the, original_usnews, final_df):
     """
     Verify that all ranking data from original sources are preserved in the merged output.
@@ -834,9 +993,14 @@ def main():
 
     try:
         # Load and clean data
-        qs_df = load_and_clean_qs()
-        the_df = load_and_clean_the()
-        usnews_df = load_and_clean_usnews()
+        # 三个数据源相互独立，并行加载（CSV 解析/字符串归一化大多释放 GIL）
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            qs_future = executor.submit(load_and_clean_qs)
+            the_future = executor.submit(load_and_clean_the)
+            usnews_future = executor.submit(load_and_clean_usnews)
+            qs_df = qs_future.result()
+            the_df = the_future.result()
+            usnews_df = usnews_future.result()
 
         # Store original counts for verification
         original_qs_count = len(qs_df)
@@ -854,7 +1018,7 @@ def main():
         output_df = deduplicate_fuzzy(output_df)
 
         # Save to CSV
-        output_df.to_csv(MERGED_FILE, index=False)
+        write_output_csv(output_df, MERGED_FILE)
         print(f"\n[OK] Merged data saved to: {MERGED_FILE}")
 
         # Verify ranking data integrity
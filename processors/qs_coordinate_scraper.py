@@ -1,15 +1,20 @@
 #!/usr/bin/env python3
 
 import sys
+import asyncio
+import csv
 import json
 import time
 import logging
 import re
 from pathlib import Path
 from datetime import datetime
-from multiprocessing import Process, Queue, current_process
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import queue
 import random
 import math
+import sqlite3
 
 import pandas as pd
 from selenium import webdriver
@@ -19,6 +24,19 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
+try:
+    import httpx
+    from selectolax.parser import HTMLParser
+
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+try:
+    import orjson  # much faster loads; stdlib json is the fallback
+except ImportError:
+    orjson = None
+
 BASE_DIR = (
     Path(__file__).parent.parent
     if (Path(__file__).parent.parent.exists())
@@ -27,15 +45,20 @@ BASE_DIR = (
 INPUT_CSV = BASE_DIR / "output" / "QS_2026_Rankings.csv"
 FINAL_OUTPUT = BASE_DIR / "output" / "QS_2026_Rankings_with_Coordinates.csv"
 URLS_CACHE = Path(__file__).parent / ".qs_university_urls.json"
+COORDS_CACHE_DB = BASE_DIR / "output" / "coords_cache.sqlite"
 
 LOG_FILE = Path(__file__).parent / "qs_scraper_parallel.log"
 WORKER_OUTPUT_DIR = BASE_DIR / "output"
 
 # Config
-NUM_WORKERS = 3  # number of parallel worker processes
-WORKER_DELAY_RANGE = (2.0, 5.0)  # seconds, random delay between requests per worker
+NUM_WORKERS = 16  # number of parallel worker threads (I/O-bound workload)
+SELENIUM_POOL_SIZE = 3  # fallback Chrome sessions shared by all threads
+MIN_REQUEST_INTERVAL = 1.0  # seconds, per-worker floor between page fetches
 CHROME_HEADLESS = True
 MAX_FETCH_ATTEMPTS = 3
+HTTP_BATCH_SIZE = 32  # concurrent HTTP requests per batch in the no-JS path
+RESULT_FIELDS = ["Rank", "Name", "Region", "Status", "Latitude", "Longitude"]
+RESULT_BATCH_SIZE = 32  # rows per cross-process queue message
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15",
@@ -44,7 +67,7 @@ USER_AGENTS = [
 
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(processName)s - %(message)s",
+    format="%(asctime)s - %(levelname)s - %(threadName)s - %(message)s",
     handlers=[
         logging.FileHandler(LOG_FILE, encoding="utf-8"),
         logging.StreamHandler(),
@@ -52,12 +75,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger("qs_parallel")
 
+# precompiled once; matched against every openMap onclick attribute
+_OPENMAP_RE = re.compile(r"openMap\(([-\d.]+),\s*([-\d.]+)\)")
+
 
 # ---------- helper: load URL cache ----------
-def load_url_cache():
-    if URLS_CACHE.exists():
+def load_url_cache(cache_path=URLS_CACHE):
+    cache_path = Path(cache_path)
+    if cache_path.exists():
         try:
-            with open(URLS_CACHE, "r", encoding="utf-8") as f:
+            if orjson is not None:
+                return orjson.loads(cache_path.read_bytes())
+            with open(cache_path, "r", encoding="utf-8") as f:
                 return json.load(f)
         except Exception as e:
             logger.warning(f"Failed to load URL cache: {e}")
@@ -65,38 +94,276 @@ def load_url_cache():
     return {}
 
 
+# ---------- HTTP-first coordinate fetch (no browser) ----------
+async def fetch_coords_http(url, client, ua):
+    """Fetch one page over plain HTTP and pull coordinates from the raw HTML.
+
+    Returns (lat, lng) on success, None when the request fails or the page
+    lacks the markers — the caller falls back to Selenium for those.
+    """
+    try:
+        r = await client.get(url, headers={"User-Agent": ua})
+        r.raise_for_status()
+    except Exception as e:
+        logger.debug(f"[http] GET {url} failed: {e}")
+        return None
+    tree = HTMLParser(r.text)
+    link = tree.css_first('a[onclick*="openMap"]')
+    if link is not None:
+        onclick = link.attributes.get("onclick") or ""
+        match = _OPENMAP_RE.search(onclick)
+        if match:
+            lat, lng = match.groups()
+            return float(lat), float(lng)
+    for opt in tree.css("option[data-latitude]"):
+        lat = opt.attributes.get("data-latitude")
+        lng = opt.attributes.get("data-longitude")
+        if lat and lng:
+            return float(lat), float(lng)
+    return None
+
+
+async def _fetch_coords_http_all(urls):
+    ua = random.choice(USER_AGENTS)
+    limits = httpx.Limits(max_keepalive_connections=HTTP_BATCH_SIZE)
+    results = {}
+    async with httpx.AsyncClient(
+        limits=limits, follow_redirects=True, timeout=15.0
+    ) as client:
+        for i in range(0, len(urls), HTTP_BATCH_SIZE):
+            batch = urls[i : i + HTTP_BATCH_SIZE]
+            coords = await asyncio.gather(
+                *(fetch_coords_http(u, client, ua) for u in batch)
+            )
+            results.update(zip(batch, coords))
+    return results
+
+
+def fetch_coords_http_bulk(urls):
+    """Resolve many URLs over keep-alive HTTP: {url: (lat, lng) or None}."""
+    if not HAS_HTTPX or not urls:
+        return {}
+    try:
+        return asyncio.run(_fetch_coords_http_all(list(urls)))
+    except Exception as e:
+        logger.warning(f"[http] bulk fetch failed, falling back to Selenium: {e}")
+        return {}
+
+
+# ---------- persistent URL -> coordinates cache ----------
+class CoordsCache:
+    """sqlite-backed URL -> (lat, lng) memo so re-runs skip scraped pages.
+
+    WAL mode lets every worker keep its own connection. Each put
+    autocommits: puts arrive one slow page-fetch apart, so an open
+    batching transaction would hold sqlite's single write lock across
+    those fetches and starve every other worker's inserts. WAL keeps
+    single-row commits cheap, and the generous connect timeout rides out
+    momentary lock contention between 16 writers.
+    """
+
+    def __init__(self, db_path=COORDS_CACHE_DB):
+        db_path = Path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS coords (url TEXT PRIMARY KEY, lat REAL, lng REAL)"
+        )
+
+    def get(self, url):
+        row = self._conn.execute(
+            "SELECT lat, lng FROM coords WHERE url = ?", (url,)
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def put(self, url, lat, lng):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO coords (url, lat, lng) VALUES (?, ?, ?)",
+            (url, lat, lng),
+        )
+
+    def close(self):
+        self._conn.close()
+
+
+# ---------- helper: widen the chromedriver command channel pool ----------
+def _widen_command_pool(driver, maxsize=16):
+    """Raise urllib3 pool maxsize on the WebDriver command channel.
+
+    The default pool holds a single connection; bursts of rapid
+    find_elements/get_attribute commands make urllib3 drop and reopen TCP
+    connections to chromedriver. Best-effort: selenium internals vary
+    across versions, so any failure here is ignored.
+    """
+    try:
+        executor = driver.command_executor
+        config = executor._client_config
+        init_args = config.init_args_for_pool_manager or {}
+        init_args.setdefault("init_args_for_pool_manager", {}).update(
+            {"maxsize": maxsize, "block": False}
+        )
+        config.init_args_for_pool_manager = init_args
+        # rebuild the pool manager so the new args take effect
+        if getattr(executor, "_conn", None) is not None:
+            executor._conn.clear()
+            executor._conn = executor._get_connection_manager()
+    except Exception as e:
+        logger.debug(f"could not widen command channel pool: {e}")
+
+
+# ---------- helper: build a Chrome session ----------
+def create_driver():
+    chrome_options = Options()
+    if CHROME_HEADLESS:
+        chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    # rotate user-agent per session
+    ua = random.choice(USER_AGENTS)
+    chrome_options.add_argument(f"user-agent={ua}")
+    # small viewport randomization
+    width = random.randint(1000, 1400)
+    height = random.randint(700, 1000)
+    chrome_options.add_argument(f"--window-size={width},{height}")
+    # skip heavyweight resources — we only read two HTML attributes
+    chrome_options.add_experimental_option(
+        "prefs",
+        {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.cookies": 1,
+        },
+    )
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    # the markers live in the initial HTML; don't wait for the load event
+    chrome_options.set_capability("pageLoadStrategy", "eager")
+
+    # You can add proxy here per worker if you have proxies:
+    # chrome_options.add_argument('--proxy-server=http://<proxy:port>')
+
+    driver = webdriver.Chrome(options=chrome_options)
+    _widen_command_pool(driver)
+    # belt and braces: also block media/fonts/analytics at the CDP level
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs",
+            {
+                "urls": [
+                    "*.png",
+                    "*.jpg",
+                    "*.jpeg",
+                    "*.gif",
+                    "*.svg",
+                    "*.woff*",
+                    "*.css",
+                    "*google-analytics*",
+                    "*doubleclick*",
+                ]
+            },
+        )
+    except Exception as e:
+        logger.debug(f"CDP resource blocking unavailable: {e}")
+    driver.set_page_load_timeout(20)
+    # no implicit wait: it compounds with the explicit WebDriverWait and
+    # stalls every negative find_elements lookup
+    driver.implicitly_wait(0)
+    return driver, ua
+
+
+# ---------- browser pool ----------
+class BrowserPool:
+    """Pool of WebDriver sessions shared by all workers for the whole run.
+
+    Chrome cold-start costs ~1-3s; keeping sessions alive and handing them
+    out to workers amortizes that over the full CSV instead of paying it
+    per worker (and per retry). With prewarm=False sessions are spawned on
+    first demand, so runs fully served by the HTTP path start no Chrome.
+    """
+
+    def __init__(self, size, prewarm=True):
+        self.size = size
+        self._pool = queue.Queue(maxsize=size)
+        self._created = 0
+        self._lock = threading.Lock()
+        if prewarm:
+            for _ in range(size):
+                self._created += 1
+                self._pool.put(self._spawn())
+
+    def _spawn(self):
+        driver, ua = create_driver()
+        logger.info(f"[pool] warmed WebDriver session (UA: {ua})")
+        return driver
+
+    def get(self, timeout=None):
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                return self._spawn()
+        return self._pool.get(timeout=timeout)
+
+    def put(self, driver):
+        self._pool.put(driver)
+
+    def replace(self, driver):
+        """Swap a dead session for a fresh one and return it."""
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"[pool] dead driver quit err: {e}")
+        fresh, ua = create_driver()
+        logger.info(f"[pool] replaced dead WebDriver session (UA: {ua})")
+        return fresh
+
+    def close(self):
+        while True:
+            try:
+                self._pool.get_nowait().quit()
+            except queue.Empty:
+                break
+            except Exception:
+                pass
+
+
 # ---------- worker class ----------
 class QSScraperWorker:
-    def __init__(self, worker_id, rows, url_cache, output_path, delay_range=(2, 5)):
+    def __init__(
+        self,
+        worker_id,
+        rows,
+        url_cache,
+        results_queue,
+        min_interval=MIN_REQUEST_INTERVAL,
+        driver=None,
+        browser_pool=None,
+    ):
         self.worker_id = worker_id
-        self.rows = rows  # list of (idx, row_series)
+        self.rows = rows  # records of (idx, Rank, Name, Region, Status)
         self.url_cache = url_cache
-        self.output_path = Path(output_path)
-        self.delay_range = delay_range
-        self.driver = None
-        self._init_driver()
+        # rank fallback prebuilt once: cache position i serves rank i+1
+        self._rank_index = {i + 1: u for i, u in enumerate(url_cache.values())}
+        self.results_queue = results_queue
+        self.min_interval = min_interval
+        self._next_allowed = 0.0
+        # a pooled driver can be injected or acquired from browser_pool;
+        # otherwise the worker owns its own, created lazily on the first
+        # page that actually needs a browser
+        self.driver = driver
+        self.browser_pool = browser_pool
+        self._owns_driver = driver is None and browser_pool is None
+        self._consecutive_failures = 0
+        self._result_batch = []
+        self.http_coords = {}
+        self.coords_cache = CoordsCache()
 
     def _init_driver(self):
-        chrome_options = Options()
-        if CHROME_HEADLESS:
-            chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        # rotate user-agent for this worker
-        ua = random.choice(USER_AGENTS)
-        chrome_options.add_argument(f"user-agent={ua}")
-        # small viewport randomization
-        width = random.randint(1000, 1400)
-        height = random.randint(700, 1000)
-        chrome_options.add_argument(f"--window-size={width},{height}")
-
-        # You can add proxy here per worker if you have proxies:
-        # chrome_options.add_argument('--proxy-server=http://<proxy:port>')
-
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.set_page_load_timeout(60)
-        self.driver.implicitly_wait(4)
+        self.driver, ua = create_driver()
         logger.info(f"[worker {self.worker_id}] WebDriver initialized (UA: {ua})")
 
     def _close_driver(self):
@@ -110,8 +377,9 @@ class QSScraperWorker:
 
     def _find_matching_url(self, csv_name, rank):
         # same logic as your original find_matching_url (but simplified)
-        if csv_name in self.url_cache:
-            return self.url_cache[csv_name]
+        url = self.url_cache.get(csv_name)
+        if url:
+            return url
         # try rank-based fallback
         try:
             if isinstance(rank, str) and "-" in rank:
@@ -120,77 +388,132 @@ class QSScraperWorker:
                 rank_num = int(rank)
         except Exception:
             return None
-        items = list(self.url_cache.items())
-        if 0 <= rank_num - 1 < len(items):
-            return items[rank_num - 1][1]
-        return None
+        return self._rank_index.get(rank_num)
+
+    def _acquire_driver(self):
+        if self.driver is not None:
+            return
+        if self.browser_pool is not None:
+            self.driver = self.browser_pool.get()
+        else:
+            self._init_driver()
+
+    def _recycle_driver(self):
+        """Replace a (likely dead) session with a fresh one."""
+        if self.browser_pool is not None:
+            self.driver = self.browser_pool.replace(self.driver)
+        else:
+            self._close_driver()
+            time.sleep(1 + random.random())
+            self._init_driver()
+
+    def _throttle(self):
+        """Token-bucket politeness: sleep only when ahead of the rate.
+
+        Unlike a fixed per-row sleep, slow fetches already consume their
+        interval, so no time is wasted on top of them.
+        """
+        wait = self._next_allowed - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._next_allowed = time.monotonic() + self.min_interval
 
     def fetch_page(self, url):
+        self._acquire_driver()
         for attempt in range(1, MAX_FETCH_ATTEMPTS + 1):
             try:
                 logger.debug(f"[worker {self.worker_id}] GET {url} (attempt {attempt})")
                 self.driver.get(url)
-                # small random sleep to mimic human
-                time.sleep(random.uniform(1.0, 2.0))
+                # wait for the selectors we actually extract, not <body>
                 WebDriverWait(self.driver, 8).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                    EC.any_of(
+                        EC.presence_of_element_located(
+                            (By.CSS_SELECTOR, 'a[onclick*="openMap"]')
+                        ),
+                        EC.presence_of_element_located(
+                            (By.CSS_SELECTOR, "option[data-latitude]")
+                        ),
+                    )
                 )
+                self._consecutive_failures = 0
                 return True
             except Exception as e:
+                self._consecutive_failures += 1
                 logger.warning(
                     f"[worker {self.worker_id}] fetch attempt {attempt} failed: {e}"
                 )
-                # try reinit driver on certain failures
+                # keep the session warm on a one-off failure; only recycle
+                # the driver once failures repeat (session likely dead)
                 if attempt < MAX_FETCH_ATTEMPTS:
-                    try:
-                        self._close_driver()
-                        time.sleep(1 + random.random())
-                        self._init_driver()
-                    except Exception as re:
-                        logger.warning(f"[worker {self.worker_id}] reinit failed: {re}")
+                    if self._consecutive_failures >= 2:
+                        try:
+                            self._recycle_driver()
+                            self._consecutive_failures = 0
+                        except Exception as re:
+                            logger.warning(
+                                f"[worker {self.worker_id}] reinit failed: {re}"
+                            )
                 else:
                     return False
         return False
 
     def extract_coordinates(self):
-        """try methods 1 and 2 (same as your original)"""
-        # Method 1
-        try:
-            links = self.driver.find_elements(By.CSS_SELECTOR, 'a[onclick*="openMap"]')
-            for link in links:
-                onclick = link.get_attribute("onclick")
-                if onclick and "openMap" in onclick:
-                    match = re.search(r"openMap\(([-\d.]+),\s*([-\d.]+)\)", onclick)
-                    if match:
-                        lat, lng = match.groups()
-                        return float(lat), float(lng)
-        except Exception:
-            pass
-
-        # Method 2
+        """both methods in one execute_script round-trip"""
         try:
-            options = self.driver.find_elements(
-                By.CSS_SELECTOR, "option[data-latitude]"
+            result = self.driver.execute_script(
+                r"""
+                var links = document.querySelectorAll('a[onclick*="openMap"]');
+                for (var i = 0; i < links.length; i++) {
+                    var m = /openMap\(([-\d.]+),\s*([-\d.]+)\)/.exec(
+                        links[i].getAttribute('onclick') || '');
+                    if (m) return [parseFloat(m[1]), parseFloat(m[2])];
+                }
+                var opts = document.querySelectorAll('option[data-latitude]');
+                for (var j = 0; j < opts.length; j++) {
+                    var lat = opts[j].getAttribute('data-latitude');
+                    var lng = opts[j].getAttribute('data-longitude');
+                    if (lat && lng) return [parseFloat(lat), parseFloat(lng)];
+                }
+                return null;
+                """
             )
-            for opt in options:
-                lat = opt.get_attribute("data-latitude")
-                lng = opt.get_attribute("data-longitude")
-                if lat and lng:
-                    return float(lat), float(lng)
+            if result:
+                return float(result[0]), float(result[1])
         except Exception:
             pass
 
         return None, None
 
-    def worker_loop(self):
-        # prepare output CSV DF
-        out_rows = []
-        for idx, row in self.rows:
-            rank = row.get("Rank")
-            name = row.get("Name")
-            region = row.get("Region", "")
-            status = row.get("Status", "")
+    def _prefetch_http_coords(self):
+        """HTTP-first pass over the whole chunk — no Chrome involved."""
+        urls = []
+        for idx, rank, name, region, status in self.rows:
+            url = self._find_matching_url(name, rank)
+            # already scraped in an earlier run — no need to refetch
+            if url and self.coords_cache.get(url) is None:
+                urls.append(url)
+        self.http_coords = fetch_coords_http_bulk(urls)
+        if urls and self.http_coords:
+            hits = sum(1 for v in self.http_coords.values() if v)
+            logger.info(
+                f"[worker {self.worker_id}] HTTP pass resolved {hits}/{len(urls)} pages"
+            )
 
+    def _emit(self, row_dict):
+        """Buffer locally and ship to the writer in batches to cut queue traffic."""
+        self._result_batch.append(row_dict)
+        if len(self._result_batch) >= RESULT_BATCH_SIZE:
+            self._flush_results()
+
+    def _flush_results(self):
+        if self._result_batch:
+            self.results_queue.put(self._result_batch)
+            self._result_batch = []
+
+    def worker_loop(self):
+        # resolve as much as possible over plain HTTP before touching Chrome
+        self._prefetch_http_coords()
+        for idx, rank, name, region, status in self.rows:
             logger.info(f"[worker {self.worker_id}] Processing: {name} (idx {idx})")
 
             # find url
@@ -199,7 +522,7 @@ class QSScraperWorker:
                 logger.warning(
                     f"[worker {self.worker_id}] URL not found for {name}, skipping"
                 )
-                out_rows.append(
+                self._emit(
                     {
                         "Rank": rank,
                         "Name": name,
@@ -209,14 +532,49 @@ class QSScraperWorker:
                         "Longitude": "",
                     }
                 )
-                # small delay
-                time.sleep(random.uniform(*self.delay_range))
                 continue
 
+            # disk-cache hit from a previous run: no network at all
+            cached = self.coords_cache.get(url)
+            if cached:
+                lat, lng = cached
+                self._emit(
+                    {
+                        "Rank": rank,
+                        "Name": name,
+                        "Region": region,
+                        "Status": status,
+                        "Latitude": lat,
+                        "Longitude": lng,
+                    }
+                )
+                continue
+
+            # HTTP-first hit: coords already resolved, skip the browser
+            coords = self.http_coords.get(url)
+            if coords:
+                lat, lng = coords
+                self.coords_cache.put(url, lat, lng)
+                logger.info(
+                    f"[worker {self.worker_id}] Got coords for {name} via HTTP: {lat:.6f},{lng:.6f}"
+                )
+                self._emit(
+                    {
+                        "Rank": rank,
+                        "Name": name,
+                        "Region": region,
+                        "Status": status,
+                        "Latitude": lat,
+                        "Longitude": lng,
+                    }
+                )
+                continue
+
+            self._throttle()
             ok = self.fetch_page(url)
             if not ok:
                 logger.warning(f"[worker {self.worker_id}] Failed to fetch {url}")
-                out_rows.append(
+                self._emit(
                     {
                         "Rank": rank,
                         "Name": name,
@@ -226,15 +584,15 @@ class QSScraperWorker:
                         "Longitude": "",
                     }
                 )
-                time.sleep(random.uniform(*self.delay_range))
                 continue
 
             lat, lng = self.extract_coordinates()
             if lat is not None and lng is not None:
+                self.coords_cache.put(url, lat, lng)
                 logger.info(
                     f"[worker {self.worker_id}] Got coords for {name}: {lat:.6f},{lng:.6f}"
                 )
-                out_rows.append(
+                self._emit(
                     {
                         "Rank": rank,
                         "Name": name,
@@ -246,7 +604,7 @@ class QSScraperWorker:
                 )
             else:
                 logger.warning(f"[worker {self.worker_id}] No coords for {name}")
-                out_rows.append(
+                self._emit(
                     {
                         "Rank": rank,
                         "Name": name,
@@ -257,42 +615,80 @@ class QSScraperWorker:
                     }
                 )
 
-            # random human-like delay
-            time.sleep(random.uniform(*self.delay_range))
+        # ship any tail rows smaller than a full batch
+        self._flush_results()
+        self.coords_cache.close()
 
-        # write worker-specific output file
-        try:
-            if len(out_rows) > 0:
-                df_out = pd.DataFrame(out_rows)
-                self.output_path.parent.mkdir(parents=True, exist_ok=True)
-                df_out.to_csv(self.output_path, index=False)
-                logger.info(f"[worker {self.worker_id}] wrote {self.output_path}")
-        except Exception as e:
-            logger.error(f"[worker {self.worker_id}] failed to write output: {e}")
-
-        # cleanup
-        self._close_driver()
+        # cleanup: pooled drivers go back to the pool, owned ones quit
+        if self.driver is not None and self.browser_pool is not None:
+            self.browser_pool.put(self.driver)
+            self.driver = None
+        elif self._owns_driver:
+            self._close_driver()
 
 
 # ---------- function: split rows into chunks ----------
 def chunk_rows(df, n_chunks):
-    rows = list(df.iterrows())
-    total = len(rows)
+    # C-contiguous record array: per-row access becomes tuple indexing
+    # instead of a Series lookup, and chunks are cheap views
+    records = df[["Rank", "Name", "Region", "Status"]].to_records(index=True)
+    total = len(records)
     chunk_size = math.ceil(total / n_chunks)
-    chunks = [rows[i * chunk_size : (i + 1) * chunk_size] for i in range(n_chunks)]
+    chunks = [records[i * chunk_size : (i + 1) * chunk_size] for i in range(n_chunks)]
     return chunks
 
 
-# ---------- worker process target ----------
-def worker_process(worker_id, rows, url_cache, out_file, delay_range):
-    # Convert rows from tuples with index to pandas Series (already are)
+# ---------- writer thread target ----------
+def writer_task(results_queue, out_file, n_workers):
+    """Single consumer: drain result rows and append to the final CSV.
+
+    Runs until it has seen one sentinel (None) per worker. Writing
+    incrementally preserves partial progress on crash and removes the
+    per-worker CSV + concat/dedup pass at the end.
+    """
+    out_file = Path(out_file)
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    seen_names = set()
+    rows_written = 0
+    done = 0
+    with open(out_file, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        while done < n_workers:
+            batch = results_queue.get()
+            if batch is None:
+                done += 1
+                continue
+            # keep first occurrence per Name (was drop_duplicates before)
+            fresh = []
+            for row in batch:
+                name = row.get("Name")
+                if name in seen_names:
+                    continue
+                seen_names.add(name)
+                fresh.append(row)
+            writer.writerows(fresh)
+            rows_written += len(fresh)
+            f.flush()
+    logger.info(f"Final output written to {out_file} ({rows_written} rows)")
+
+
+# ---------- worker thread target ----------
+def worker_task(worker_id, rows, url_cache, results_queue, min_interval, browser_pool):
     try:
         scraper = QSScraperWorker(
-            worker_id, rows, url_cache, out_file, delay_range=delay_range
+            worker_id,
+            rows,
+            url_cache,
+            results_queue,
+            min_interval=min_interval,
+            browser_pool=browser_pool,
         )
         scraper.worker_loop()
     except Exception as e:
         logger.exception(f"[worker {worker_id}] unexpected error: {e}")
+    finally:
+        results_queue.put(None)  # sentinel: this worker is done
 
 
 # ---------- main ----------
@@ -309,7 +705,8 @@ def main():
         logger.error(f"Failed to load CSV: {e}")
         return 1
 
-    # load url cache (extracted previously by your script)
+    # load url cache (extracted previously by your script); threads share
+    # the one dict, so it is parsed exactly once
     url_cache = load_url_cache()
     if not url_cache:
         logger.warning(
@@ -320,42 +717,35 @@ def main():
     num_workers = min(NUM_WORKERS, max(1, len(df)))
     chunks = chunk_rows(df, num_workers)
 
-    processes = []
-    worker_out_files = []
-    for i, chunk in enumerate(chunks):
-        worker_id = i + 1
-        out_file = WORKER_OUTPUT_DIR / f"qs_out_worker_{worker_id}.csv"
-        worker_out_files.append(out_file)
-        p = Process(
-            target=worker_process,
-            args=(worker_id, chunk, url_cache, out_file, WORKER_DELAY_RANGE),
-            name=f"Worker-{worker_id}",
-        )
-        p.start()
-        processes.append(p)
-        time.sleep(1.0)
-
-    # wait for workers
-    for p in processes:
-        p.join()
-
-    # merge outputs
-    dfs = []
-    for f in worker_out_files:
-        if f.exists():
-            try:
-                dfs.append(pd.read_csv(f))
-            except Exception as e:
-                logger.warning(f"Failed to read {f}: {e}")
-
-    if dfs:
-        df_merged = pd.concat(dfs, ignore_index=True)
-        df_merged = df_merged.drop_duplicates(subset=["Name"], keep="first")
-        FINAL_OUTPUT.parent.mkdir(parents=True, exist_ok=True)
-        df_merged.to_csv(FINAL_OUTPUT, index=False)
-        logger.info(f"Final output written to {FINAL_OUTPUT} ({len(df_merged)} rows)")
-    else:
-        logger.warning("No worker outputs found; nothing to merge")
+    # single shared result queue drained by one writer thread
+    results_queue = queue.Queue()
+    writer = threading.Thread(
+        target=writer_task,
+        args=(results_queue, FINAL_OUTPUT, len(chunks)),
+        name="Writer",
+    )
+    writer.start()
+
+    # Chrome is only the fallback, so a few shared sessions (spawned on
+    # demand) serve all worker threads
+    browser_pool = BrowserPool(SELENIUM_POOL_SIZE, prewarm=False)
+    with ThreadPoolExecutor(
+        max_workers=num_workers, thread_name_prefix="Worker"
+    ) as executor:
+        for i, chunk in enumerate(chunks):
+            executor.submit(
+                worker_task,
+                i + 1,
+                chunk,
+                url_cache,
+                results_queue,
+                MIN_REQUEST_INTERVAL,
+                browser_pool,
+            )
+
+    # workers are done; wait for the writer to drain the queue
+    writer.join()
+    browser_pool.close()
 
     logger.info("All done")
     return 0
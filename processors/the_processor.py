@@ -1,5 +1,6 @@
 import kagglehub
 import pandas as pd
+import shutil
 from pathlib import Path
 import sys
 
@@ -24,13 +25,43 @@ def main():
         # Step 2: Load the CSV
         print("2. Loading data...")
         csv_file = Path(dataset_path) / "THE World University Rankings 2016-2025.csv"
-        df = pd.read_csv(csv_file)
-        print(f"   ✓ Loaded {len(df):,} records from CSV")
+        cache_dir = Path(__file__).parent / ".the_parquet_cache"
+        df_2025 = None
+        if cache_dir.exists():
+            # predicate pushdown: only the Year=2025 partition is read
+            df_2025 = pd.read_parquet(
+                cache_dir,
+                filters=[("Year", "=", 2025)],
+                columns=["Rank", "Name", "Country"],
+            )
+            print(f"   ✓ Loaded {len(df_2025):,} records from parquet cache")
+        else:
+            # only 4 of the columns are used; narrow dtypes keep the
+            # 10-year dataset small in memory
+            df = pd.read_csv(
+                csv_file,
+                usecols=["Rank", "Name", "Country", "Year"],
+                dtype={"Name": "string", "Country": "category", "Year": "int16"},
+            )
+            print(f"   ✓ Loaded {len(df):,} records from CSV")
+            tmp_dir = cache_dir.with_name(cache_dir.name + ".tmp")
+            try:
+                # partition by Year so later runs skip the other years;
+                # write to a scratch dir and rename into place so a
+                # half-written dataset never passes the exists() check
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                df.to_parquet(tmp_dir, partition_cols=["Year"])
+                tmp_dir.rename(cache_dir)
+            except Exception:
+                # no parquet engine or a mid-write failure; leave no
+                # partial cache behind
+                shutil.rmtree(tmp_dir, ignore_errors=True)
         print()
 
         # Step 3: Process 2025 data
         print("3. Processing 2025 data...")
-        df_2025 = df[df["Year"] == 2025].copy()
+        if df_2025 is None:
+            df_2025 = df[df["Year"] == 2025].copy()
         print(f"   ✓ Found {len(df_2025):,} universities in 2025")
         print()
 
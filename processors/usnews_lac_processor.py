@@ -12,62 +12,52 @@ def parse_usnews_lac_txt(filepath):
     with open(filepath, "r", encoding="utf-8") as f:
         lines = f.readlines()
 
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
+    # Single forward pass. The "Name / Location" pair always precedes its
+    # "#rank" line, so remember the most recent candidate while scanning
+    # instead of walking backwards from every rank line (O(N^2) overall).
+    name = None
+    location = None
+    skip_rank_until = 0
+
+    for i, raw in enumerate(lines):
+        line = raw.strip()
+
+        # Candidate location line (the name sits on the line right above it)
+        if line and not line.startswith("#") and line != "in" and "," in line:
+            location = line
+            name = lines[i - 1].strip() if i > 0 else None
+
+        # "#X" line plus the "in"/category lines are not rank candidates
+        if i < skip_rank_until:
+            continue
 
         # Look for rank pattern like "#1", "#2", "#5 (tie)" etc
-        if (
+        if not (
             line.startswith("#") and "in" in lines[i + 1].strip()
             if i + 1 < len(lines)
             else False
         ):
-            # Extract rank number
-            rank_text = line.replace("#", "").split()[0]
+            continue
+
+        # Extract rank number
+        rank_text = line.replace("#", "").split()[0]
+        try:
+            rank = int(rank_text)
+        except:
+            continue
+
+        skip_rank_until = i + 4
+
+        if name and location:
+            # Extract state/region from location (e.g., "Williamstown, MA" -> "MA")
             try:
-                rank = int(rank_text)
+                region = location.split(",")[-1].strip()
             except:
-                i += 1
-                continue
-
-            # Skip "in" line and category line
-            i += 2  # skip "#X" line and "in" line
-            i += 1  # skip category line
-
-            # Next should be college name or tuition line
-            # Skip through data fields until we find the name and location
-            name = None
-            location = None
-
-            # Go back and find name (name appears right before the rank)
-            j = i - 4
-            while j >= 0:
-                prev_line = lines[j].strip()
-                if (
-                    prev_line
-                    and not prev_line.startswith("#")
-                    and not prev_line == "in"
-                    and "," in prev_line
-                ):
-                    # This is likely the location line
-                    location = prev_line
-                    if j > 0:
-                        name = lines[j - 1].strip()
-                    break
-                j -= 1
-
-            if name and location:
-                # Extract state/region from location (e.g., "Williamstown, MA" -> "MA")
-                try:
-                    region = location.split(",")[-1].strip()
-                except:
-                    region = location
-
-                records.append({"Rank": rank, "Name": name, "Region": region})
-
-        i += 1
-
-    return pd.DataFrame(records)
+                region = location
+
+            records.append({"Rank": rank, "Name": name, "Region": region})
+
+    return pd.DataFrame.from_records(records)
 
 
 def main():